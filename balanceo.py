@@ -0,0 +1,233 @@
+"""
+Balanceo de ecuaciones químicas por álgebra lineal exacta.
+
+Una ecuación  a·A + b·B -> c·C  está balanceada cuando, para cada elemento,
+los átomos de los reactivos igualan a los de los productos. Eso es el sistema
+homogéneo  M·k = 0, donde M tiene una fila por elemento y una columna por
+especie (productos con signo negativo) y k son los coeficientes buscados.
+
+Los coeficientes son el núcleo (espacio nulo) de M. Se obtiene con eliminación
+gaussiana sobre fracciones exactas (fractions.Fraction): las matrices de una
+reacción son pequeñas (decenas de filas/columnas a lo sumo), y la aritmética
+exacta da enteros sin redondeos ni tolerancias, algo que un SVD en coma
+flotante no garantiza.
+
+Uso:
+  >>> balancear_ecuacion("H2 + O2 -> H2O")
+  '2 H2 + O2 -> 2 H2O'
+"""
+import re
+from collections import Counter
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd, lcm
+
+# Fragmentos de fórmula: símbolo con subíndice, paréntesis que abre,
+# o paréntesis que cierra con multiplicador opcional ("Ca(OH)2").
+_TOKEN = re.compile(r"([A-Z][a-z]?)(\d*)|(\()|\)(\d*)")
+# Separadores entre lados de la ecuación: "->", "→" o "=".
+_FLECHA = re.compile(r"->|→|=")
+# Especie con coeficiente estequiométrico opcional delante: "2 H2O", "2H2O", "O2".
+_ESPECIE = re.compile(r"(\d*)\s*(.+)")
+
+
+def composicion(formula: str) -> dict:
+    """
+    Contar los átomos de cada elemento de una fórmula, con paréntesis anidados.
+      composicion("Ca(OH)2") -> {"Ca": 1, "O": 2, "H": 2}
+    Lanza ValueError si la fórmula no se puede analizar.
+    """
+    pila = [Counter()]
+    pos = 0
+    while pos < len(formula):
+        m = _TOKEN.match(formula, pos)
+        if m is None:
+            raise ValueError(f"Fórmula no válida: '{formula}'.")
+        simbolo, n, abre, n_grupo = m.groups()
+        if simbolo:
+            pila[-1][simbolo] += int(n) if n else 1
+        elif abre:
+            pila.append(Counter())
+        else:
+            if len(pila) == 1:
+                raise ValueError(f"Paréntesis sin abrir en '{formula}'.")
+            grupo = pila.pop()
+            k = int(n_grupo) if n_grupo else 1
+            for simbolo_g, c in grupo.items():
+                pila[-1][simbolo_g] += c * k
+        pos = m.end()
+    if len(pila) != 1:
+        raise ValueError(f"Paréntesis sin cerrar en '{formula}'.")
+    if not pila[0]:
+        raise ValueError(f"Fórmula no válida: '{formula}'.")
+    return dict(pila[0])
+
+
+def _espacio_nulo(matriz: list) -> list:
+    """
+    Base del espacio nulo de una matriz (lista de filas de Fraction).
+    Se reduce a forma escalonada reducida y cada columna libre da un vector.
+    """
+    filas = [fila[:] for fila in matriz]
+    n_cols = len(filas[0]) if filas else 0
+    pivotes = []
+    r = 0
+    for c in range(n_cols):
+        # Buscar una fila con valor no nulo en la columna c
+        p = next((i for i in range(r, len(filas)) if filas[i][c] != 0), None)
+        if p is None:
+            continue
+        filas[r], filas[p] = filas[p], filas[r]
+        piv = filas[r][c]
+        filas[r] = [v / piv for v in filas[r]]
+        for i in range(len(filas)):
+            if i != r and filas[i][c] != 0:
+                f = filas[i][c]
+                filas[i] = [a - f * b for a, b in zip(filas[i], filas[r])]
+        pivotes.append(c)
+        r += 1
+        if r == len(filas):
+            break
+
+    base = []
+    for libre in (c for c in range(n_cols) if c not in pivotes):
+        v = [Fraction(0)] * n_cols
+        v[libre] = Fraction(1)
+        for fila, c in zip(filas, pivotes):
+            v[c] = -fila[libre]
+        base.append(v)
+    return base
+
+
+@lru_cache(maxsize=256)
+def _coeficientes(reactivos: tuple, productos: tuple) -> tuple:
+    """
+    Resolver el balanceo de una ecuación ya normalizada (ver balancear).
+    Memoizado: repetir la misma reacción no vuelve a escalonar la matriz.
+    """
+    especies = reactivos + productos
+    comps = [composicion(f) for f in especies]
+    elementos = sorted({el for comp in comps for el in comp})
+
+    # Matriz elementos x especies; los productos restan átomos.
+    signos = [1] * len(reactivos) + [-1] * len(productos)
+    matriz = [
+        [Fraction(s * comp.get(el, 0)) for comp, s in zip(comps, signos)]
+        for el in elementos
+    ]
+
+    base = _espacio_nulo(matriz)
+    if not base:
+        raise ValueError("La ecuación no se puede balancear con esas especies.")
+    if len(base) > 1:
+        raise ValueError("La ecuación no tiene un balance único.")
+
+    # Forma canónica: enteros (mcm de denominadores), primos entre sí y positivos.
+    v = base[0]
+    escala = lcm(*(x.denominator for x in v))
+    coefs = [int(x * escala) for x in v]
+    divisor = gcd(*coefs)
+    coefs = [c // divisor for c in coefs]
+    if all(c < 0 for c in coefs):
+        coefs = [-c for c in coefs]
+    if any(c <= 0 for c in coefs):
+        raise ValueError("La ecuación no se puede balancear con esas especies.")
+    return tuple(coefs)
+
+
+def balancear(reactivos: list, productos: list) -> list:
+    """
+    Coeficientes enteros mínimos que balancean reactivos -> productos.
+    Parámetros:
+      - reactivos, productos: listas de fórmulas ("H2", "O2", ...).
+    Retorna:
+      - Lista de enteros positivos, en el orden reactivos + productos.
+    Lanza:
+      - ValueError si alguna fórmula es inválida o la ecuación no tiene
+        un balance único con coeficientes positivos.
+    Cada lado se ordena antes de resolver, de modo que "H2 + O2 -> H2O" y
+    "O2 + H2 -> H2O" comparten la misma entrada del caché de _coeficientes;
+    luego los coeficientes se devuelven en el orden original.
+    """
+    reactivos, productos = list(reactivos), list(productos)
+    if not reactivos or not productos:
+        raise ValueError("La ecuación necesita reactivos y productos.")
+    orden_r = sorted(range(len(reactivos)), key=reactivos.__getitem__)
+    orden_p = sorted(range(len(productos)), key=productos.__getitem__)
+    coefs = _coeficientes(
+        tuple(reactivos[i] for i in orden_r),
+        tuple(productos[i] for i in orden_p),
+    )
+
+    # Deshacer el orden: la posición k del resultado ordenado es la especie orden[k]
+    n = len(reactivos)
+    resultado = [0] * len(coefs)
+    for k, i in enumerate(orden_r):
+        resultado[i] = coefs[k]
+    for k, i in enumerate(orden_p):
+        resultado[n + i] = coefs[n + k]
+    return resultado
+
+
+def _lado(texto: str) -> tuple:
+    """
+    Separar un lado de la ecuación en fórmulas y coeficientes escritos:
+      "2 H2 + O2" -> (["H2", "O2"], [2, 1])
+    Sin coeficiente delante, la especie cuenta con 1.
+    """
+    formulas, coefs = [], []
+    for parte in texto.split("+"):
+        parte = parte.strip()
+        if parte:
+            m = _ESPECIE.fullmatch(parte)
+            if m is None:
+                raise ValueError(f"Fórmula no válida: '{parte}'.")
+            n, f = m.groups()
+            formulas.append(f.strip())
+            coefs.append(int(n) if n else 1)
+    return formulas, coefs
+
+
+def _esta_balanceada(reactivos: list, productos: list, coefs: list) -> bool:
+    """
+    Comprobar si los coeficientes escritos ya balancean la ecuación
+    (mismos átomos de cada elemento a ambos lados). Sólo cuenta átomos:
+    no hace falta escalonar ninguna matriz.
+    """
+    if not reactivos or not productos or any(k <= 0 for k in coefs):
+        return False
+    signos = [1] * len(reactivos) + [-1] * len(productos)
+    balance = Counter()
+    for f, k, s in zip(reactivos + productos, coefs, signos):
+        for el, c in composicion(f).items():
+            balance[el] += s * c * k
+    return not any(balance.values())
+
+
+def balancear_ecuacion(ecuacion: str) -> str:
+    """
+    Balancear una ecuación escrita como texto y devolverla con coeficientes.
+      balancear_ecuacion("Fe + O2 -> Fe2O3") -> "4 Fe + 3 O2 -> 2 Fe2O3"
+    Si los coeficientes escritos ya balancean los átomos ("2 H2 + O2 -> 2 H2O"),
+    se reducen a sus mínimos enteros y se omite la resolución del sistema.
+    Lanza ValueError si la ecuación está mal escrita o no se puede balancear.
+    """
+    lados = _FLECHA.split(ecuacion)
+    if len(lados) != 2:
+        raise ValueError("Escriba la ecuación como 'reactivos -> productos'.")
+    (reactivos, coefs_r), (productos, coefs_p) = _lado(lados[0]), _lado(lados[1])
+    coefs = coefs_r + coefs_p
+    if _esta_balanceada(reactivos, productos, coefs):
+        # Misma forma canónica que _coeficientes: enteros primos entre sí
+        divisor = gcd(*coefs)
+        coefs = [c // divisor for c in coefs]
+    else:
+        coefs = balancear(reactivos, productos)
+
+    def _formatear(especies, coefs_lado):
+        return " + ".join(
+            f"{c} {f}" if c != 1 else f for c, f in zip(coefs_lado, especies)
+        )
+
+    n = len(reactivos)
+    return f"{_formatear(reactivos, coefs[:n])} -> {_formatear(productos, coefs[n:])}"
@@ -0,0 +1,237 @@
+"""
+Backend de cálculo estequiométrico (sin interfaz gráfica).
+
+Reúne la lógica que comparten las dos interfaces de la aplicación:
+  - estequiometria_explica.py (Tkinter, documentada).
+  - estequiometricos.py (consola).
+Así el caché de masas molares, la tabla de masas atómicas y la carga del
+motor químico (`periodictable`) existen una sola vez, y cualquier mejora
+del cálculo llega a ambas interfaces.
+
+Este módulo no importa tkinter: se puede usar desde scripts, pruebas o un
+servicio sin abrir ninguna ventana.
+"""
+import json
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from balanceo import balancear_ecuacion, composicion
+
+__all__ = [
+    "TABLA_GENERADA",
+    "cargar_motor_quimico",
+    "masa_molar",
+    "calcular_moles",
+    "intentar_procesamiento",
+    "intentar_balanceo",
+]
+
+# Motor químico opcional (`periodictable`). Su importación carga la tabla completa
+# de elementos e isótopos, así que NO se hace al importar este módulo: se carga
+# con cargar_motor_quimico, de forma perezosa (solo si una fórmula no se resuelve
+# con la tabla de masas) o en un hilo al arrancar la interfaz si falta
+# masas_atomicas.json (ver TABLA_GENERADA).
+formula = None
+_PT_LISTO = threading.Event()
+
+# Masas atómicas medias (g/mol) de los elementos habituales en clase.
+# Valores estándar abreviados de la IUPAC; pueden diferir de `periodictable`
+# a partir de la 4.ª-5.ª cifra significativa. Se usan solo si no existe la
+# tabla generada (ver más abajo); los elementos que falten se resuelven
+# con `periodictable`.
+_ATOMIC_BASE = {
+    "H": 1.008, "He": 4.0026, "Li": 6.94, "Be": 9.0122, "B": 10.81,
+    "C": 12.011, "N": 14.007, "O": 15.999, "F": 18.998, "Ne": 20.180,
+    "Na": 22.990, "Mg": 24.305, "Al": 26.982, "Si": 28.085, "P": 30.974,
+    "S": 32.06, "Cl": 35.45, "Ar": 39.95, "K": 39.098, "Ca": 40.078,
+    "Sc": 44.956, "Ti": 47.867, "V": 50.942, "Cr": 51.996, "Mn": 54.938,
+    "Fe": 55.845, "Co": 58.933, "Ni": 58.693, "Cu": 63.546, "Zn": 65.38,
+    "Ga": 69.723, "Ge": 72.630, "As": 74.922, "Se": 78.971, "Br": 79.904,
+    "Kr": 83.798, "Rb": 85.468, "Sr": 87.62, "Mo": 95.95, "Ag": 107.87,
+    "Cd": 112.41, "Sn": 118.71, "Sb": 121.76, "I": 126.90, "Xe": 131.29,
+    "Cs": 132.91, "Ba": 137.33, "W": 183.84, "Pt": 195.08, "Au": 196.97,
+    "Hg": 200.59, "Pb": 207.2, "Bi": 208.98, "U": 238.03,
+}
+
+# Tabla completa generada con generar_masas.py a partir de `periodictable`:
+# cargar este JSON es mucho más rápido que importar la librería y, al venir
+# de ella, da las mismas masas que su analizador.
+_MASAS_JSON = Path(__file__).with_name("masas_atomicas.json")
+
+def _cargar_masas_atomicas() -> dict:
+    """Leer masas_atomicas.json si existe; si no (o está dañado), la tabla integrada."""
+    try:
+        with open(_MASAS_JSON, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return _ATOMIC_BASE
+
+_ATOMIC = _cargar_masas_atomicas()
+# True si se cargó masas_atomicas.json: cubre todos los elementos, así que
+# `periodictable` solo se importa si una fórmula no la analiza _simple_mass.
+TABLA_GENERADA = _ATOMIC is not _ATOMIC_BASE
+
+# Nota que acompaña al resultado provisional (las cifras van a la tabla de la UI).
+_NOTA = (
+    "Nota: Este cálculo es de referencia. El motor completo de procesamiento\n"
+    "puede incorporar balanceo de ecuaciones, reactivo limitante, rendimientos, etc."
+)
+
+def cargar_motor_quimico() -> bool:
+    """
+    Importar `periodictable` una sola vez y publicar su `formula` a nivel de módulo.
+    - Se puede llamar desde un hilo (App lo hace al arrancar si no hay
+      tabla generada) o de forma perezosa
+      desde el propio backend; las llamadas posteriores no repiten la importación.
+    - Si la librería no está instalada, el backend queda marcado como no disponible
+      y la UI lo comunica de forma amigable.
+    Retorna:
+      - True si el motor químico está disponible.
+    """
+    global formula
+    if not _PT_LISTO.is_set():
+        try:
+            from periodictable import formula as _formula
+            formula = _formula
+        except Exception:
+            formula = None
+        _PT_LISTO.set()
+    return formula is not None
+
+def _simple_mass(compuesto: str):
+    """
+    Masa molar de una fórmula sin recurrir a `periodictable`.
+    - Cuenta los átomos con balanceo.composicion (expresión regular precompilada
+      que debe cubrir toda la cadena): símbolos, subíndices y paréntesis
+      anidados ("H2O", "C6H12O6", "Ca(OH)2"). Hidratos, isótopos o cargas
+      quedan fuera.
+    - Cada elemento se busca en _ATOMIC y se multiplica por su número de átomos.
+    Retorna:
+      - La masa molar (g/mol), o None si la fórmula no se pudo analizar o algún
+        elemento no está en la tabla (el llamador usa entonces `periodictable`).
+    """
+    try:
+        atomos = composicion(compuesto)
+    except ValueError:
+        return None
+    total = 0.0
+    for simbolo, n in atomos.items():
+        masa = _ATOMIC.get(simbolo)
+        if masa is None:
+            return None
+        total += masa * n
+    return total
+
+@lru_cache(maxsize=4096)
+def _mm(compuesto: str) -> float:
+    """
+    Masa molar (g/mol) de una fórmula química, memoizada por cadena.
+    - Las fórmulas habituales se calculan con _simple_mass (regex + tabla).
+    - El resto se analiza con `periodictable`, si está disponible.
+    - Las consultas repetidas (p. ej. pulsar 'Calcular' varias veces con "H2O")
+      se resuelven con una búsqueda en el caché, sin volver a analizarlas.
+    - Las fórmulas inválidas lanzan excepción y no se guardan en el caché.
+    """
+    masa = _simple_mass(compuesto)
+    if masa is not None:
+        return masa
+    if not cargar_motor_quimico():
+        raise RuntimeError("La librería 'periodictable' no está disponible.")
+    return formula(compuesto).mass
+
+def masa_molar(compuesto: str) -> float:
+    """
+    Masa molar (g/mol) de una fórmula química ("H2O", "NaCl", "Ca(OH)2").
+    - Punto de entrada público de _mm: comparte su caché entre interfaces.
+    - Lanza RuntimeError si la fórmula necesita `periodictable` y no está
+      instalada, y la excepción del analizador si la fórmula es inválida.
+    """
+    return _mm(compuesto)
+
+def calcular_moles(compuestos, masas) -> list:
+    """
+    Cálculo por lotes: masa molar y moles para N compuestos en una sola pasada.
+    - Pensado para uso programático (por ejemplo, una tabla completa de una
+      reacción con muchos reactivos y productos) además de la UI.
+    - Cada fórmula distinta se resuelve una sola vez con _mm, aunque se repita
+      (p. ej. comparar dos masas del mismo compuesto); luego se recorren las
+      dos secuencias en paralelo (una lista de fórmulas y otra de masas).
+    Parámetros:
+      - compuestos: secuencia de fórmulas químicas ("H2", "O2", ...).
+      - masas: secuencia de masas en gramos, en el mismo orden.
+    Retorna:
+      - Lista de tuplas (compuesto, masa_g, masa_molar_g_mol, moles).
+    Lanza:
+      - ValueError si las longitudes no coinciden o alguna masa molar no es válida.
+    """
+    if len(compuestos) != len(masas):
+        raise ValueError("Debe haber una masa por cada compuesto.")
+    # dict.fromkeys conserva el orden y descarta fórmulas repetidas
+    mm_por_formula = {comp: _mm(comp) for comp in dict.fromkeys(compuestos)}
+    if any(mm <= 0 for mm in mm_por_formula.values()):
+        raise ValueError("Masas molares no válidas.")
+    # n = m (g) / M (g/mol)
+    return [
+        (comp, masa, mm_por_formula[comp], masa / mm_por_formula[comp])
+        for comp, masa in zip(compuestos, masas)
+    ]
+
+def intentar_procesamiento(comp1: str, masa1: float, comp2: str, masa2: float) -> tuple:
+    """
+    Propósito:
+      - Ejemplo de 'backend' sencillo que intenta calcular masas molares y moles.
+      - En una arquitectura inspirada en Tekniker, esta función representaría
+        una capa de cálculo que podría vivir en otro proceso/máquina.
+    Diseño:
+      - La UI NO debe implementar cálculos complejos; solo invoca funciones
+        o servicios que encapsulan la lógica. Esto facilita pruebas y reemplazo
+        por motores más avanzados (balanceo, reactivo limitante, visión química).
+    Flujo:
+      1. Calcular masa molar y moles (n = m / M) con calcular_moles. Las fórmulas
+         habituales (símbolos, subíndices, paréntesis) no necesitan
+         `periodictable`; el resto sí.
+      2. Si una fórmula necesita `periodictable` y no está disponible, devolver
+         un mensaje claro que indique que el cálculo real se hará cuando el
+         backend esté disponible.
+    Parámetros:
+      - comp1, comp2: fórmulas químicas como cadenas ("H2", "O2", "NaCl").
+      - masa1, masa2: masas en gramos (float).
+    Retorna:
+      - Tupla (filas, mensaje):
+        * filas: lista de tuplas (compuesto, masa_g, masa_molar_g_mol, moles),
+          una por reactivo, lista para mostrarse como tabla. Vacía si falla.
+        * mensaje: nota de referencia, o el error/aviso para el usuario.
+    """
+    try:
+        # Masas molares (g/mol, con caché) y moles de ambos reactivos en un lote.
+        # calcular_moles valida que las masas molares sean positivas.
+        filas = calcular_moles((comp1, comp2), (masa1, masa2))
+    except RuntimeError:
+        # La importación opcional falló: la aplicación funciona igual
+        # y aquí se informa al usuario de forma amigable.
+        return [], (
+            "⚠️ Procesamiento en revisión:\n"
+            "- La librería 'periodictable' no está disponible o el backend está pendiente.\n"
+            "- La interfaz funciona, pero los cálculos finales se integrarán más adelante."
+        )
+    except Exception as e:
+        # Mensaje de error útil para el usuario y para depuración.
+        return [], f"Ocurrió un problema durante el cálculo provisional: {e}"
+
+    return filas, _NOTA
+
+def intentar_balanceo(ecuacion: str) -> str:
+    """
+    Backend de balanceo para la UI: devuelve texto listo para mostrar.
+    - Delega en balanceo.balancear_ecuacion (espacio nulo de la matriz de átomos).
+    - Nunca lanza: los errores de escritura o de balanceo vuelven como mensaje,
+      igual que en intentar_procesamiento.
+    """
+    try:
+        return f"=== ECUACIÓN BALANCEADA ===\n{balancear_ecuacion(ecuacion)}"
+    except ValueError as e:
+        return f"No se pudo balancear la ecuación: {e}"
+    except Exception as e:
+        # Cualquier otro fallo también llega a la UI como texto.
+        return f"Ocurrió un problema durante el balanceo: {e}"
@@ -31,6 +31,20 @@ Fecha: 2025-09-03
 # Separación clara: todas las importaciones relacionadas con la UI están en este archivo.
 import tkinter as tk                # Módulo base Tkinter: ventanas, eventos, widgets básicos
 from tkinter import ttk, messagebox # ttk: widgets estilizados; messagebox: diálogos (alertas, info, error)
+import math                         # math.isfinite: descartar masas desbordadas ("1e999")
+import queue                        # Resultados del hilo de cálculo hacia la UI
+import re                           # Validación de números con una expresión precompilada
+import threading                    # Carga del motor químico en segundo plano
+from concurrent.futures import ThreadPoolExecutor  # Hilo de cálculo (fuera del bucle de Tk)
+
+# Backend en un módulo aparte (compartido con la versión de consola): la UI
+# solo invoca estas funciones, nunca implementa los cálculos.
+from estequiometria_backend import (
+    TABLA_GENERADA,
+    cargar_motor_quimico,
+    intentar_balanceo,
+    intentar_procesamiento,
+)
 
 # ================================
 # CONSTANTES DE CONFIGURACIÓN DE LA VENTANA
@@ -39,74 +53,15 @@ from tkinter import ttk, messagebox # ttk: widgets estilizados; messagebox: diá
 # Diseño: mantener constantes al inicio facilita cambiar el layout global.
 APP_TITLE = "Estequiometría - Interfaz (Tkinter) - Documentado"
 APP_WIDTH = 740
-APP_HEIGHT = 520
+APP_HEIGHT = 660
 
-# ================================
-# FUNCIÓN DE PROCESAMIENTO (BACKEND PROVISIONAL)
-# ================================
-def intentar_procesamiento(comp1: str, masa1: float, comp2: str, masa2: float) -> str:
-    """
-    Propósito:
-      - Ejemplo de 'backend' sencillo que intenta calcular masas molares y moles.
-      - En una arquitectura inspirada en Tekniker, esta función representaría
-        una capa de cálculo que podría vivir en otro proceso/máquina.
-    Diseño:
-      - La UI NO debe implementar cálculos complejos; solo invoca funciones
-        o servicios que encapsulan la lógica. Esto facilita pruebas y reemplazo
-        por motores más avanzados (balanceo, reactivo limitante, visión química).
-    Flujo:
-      1. Intentar importar la librería `periodictable` (si está disponible).
-      2. Si no está, devolver un mensaje claro que indique que el cálculo
-         real se hará cuando el backend esté disponible.
-      3. Si está disponible, calcular masa molar y moles (n = m / M).
-    Parámetros:
-      - comp1, comp2: fórmulas químicas como cadenas ("H2", "O2", "NaCl").
-      - masa1, masa2: masas en gramos (float).
-    Retorna:
-      - Texto formateado con el resultado o un mensaje de error/amplio.
-    """
-    try:
-        # IMPORTACIÓN LOCAL: se hace aquí para que la aplicación pueda arrancar
-        # incluso si la librería no está instalada. Esto mantiene la UI aislada.
-        from periodictable import formula
-    except Exception:
-        # Mensaje destilado y amigable para el usuario.
-        return (
-            "⚠️ Procesamiento en revisión:\n"
-            "- La librería 'periodictable' no está disponible o el backend está pendiente.\n"
-            "- La interfaz funciona, pero los cálculos finales se integrarán más adelante."
-        )
+# Tabla de traducción precalculada: coma decimal -> punto (locales con coma).
+_DEC = str.maketrans({",": "."})
 
-    try:
-        # Obtener masa molar (g/mol) a partir de la fórmula química
-        mm1 = formula(comp1).mass
-        mm2 = formula(comp2).mass
-
-        # Validaciones sencillas: si alguna masa molar es inválida, se informa.
-        if mm1 <= 0 or mm2 <= 0:
-            raise ValueError("Masas molares no válidas.")
-
-        # Cálculo de moles: n = m (g) / M (g/mol)
-        moles1 = masa1 / mm1
-        moles2 = masa2 / mm2
-
-        # Preparar una salida de texto clara para la UI.
-        return (
-            "=== RESULTADO (provisional) ===\n"
-            f"Reactivo 1: {comp1}\n"
-            f" - Masa ingresada: {masa1:.6g} g\n"
-            f" - Masa molar:     {mm1:.6g} g/mol\n"
-            f" - Moles:          {moles1:.6g} mol\n\n"
-            f"Reactivo 2: {comp2}\n"
-            f" - Masa ingresada: {masa2:.6g} g\n"
-            f" - Masa molar:     {mm2:.6g} g/mol\n"
-            f" - Moles:          {moles2:.6g} mol\n\n"
-            "Nota: Este cálculo es de referencia. El motor completo de procesamiento\n"
-            "puede incorporar balanceo de ecuaciones, reactivo limitante, rendimientos, etc."
-        )
-    except Exception as e:
-        # Mensaje de error útil para el usuario y para depuración.
-        return f"Ocurrió un problema durante el cálculo provisional: {e}"
+# Número decimal (ya normalizado con _DEC) y exponente opcional: "12", "0.5", ".5", "1e-3".
+# Rechaza "nan", "inf" o "1_000", que float() aceptaría pero no son masas válidas.
+# Un exponente enorme ("1e999") sí encaja y desborda a inf: lo descarta _validar_float.
+_NUM = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
 
 # ================================
 # CLASE PRINCIPAL DE LA INTERFAZ (Vista)
@@ -124,6 +79,27 @@ class App(tk.Tk):
       - Pasar un objeto 'backend' (inyección de dependencias) para permitir mocks
         y pruebas unitarias (por ejemplo: App(backend=my_backend)).
     """
+    # Filas de cada tarjeta de reactivo: (texto de la etiqueta, fila del grid).
+    # Se definen una vez a nivel de clase y las recorre _make_reactant_card.
+    _LABEL_SPEC = (("Fórmula (ej: {ejemplo}):", 0), ("Masa (g):", 1))
+    # Opciones de grid comunes a todas las etiquetas de campo (ver _field_label).
+    _FIELD_GRID = {"sticky": "e", "padx": 6, "pady": 6}
+    # Reactivos del formulario: (fórmula de ejemplo, padx de su tarjeta).
+    _REACTIVOS = (("H2", (0, 4)), ("O2", (4, 0)))
+    # Columnas de la tabla de resultados y sus encabezados.
+    _COLUMNAS = ("compuesto", "masa", "mm", "moles")
+    _TITULOS = ("Compuesto", "Masa (g)", "Masa molar (g/mol)", "Moles (mol)")
+    # Medidas de la pantalla (ancho, alto); las rellena _center_window una vez.
+    _pantalla = None
+    # Estilos ttk: nombre de estilo -> opciones. Los aplica _apply_style.
+    _STYLES = {
+        "TButton": {"padding": 8},
+        "TLabel": {"padding": 2},
+        "Header.TLabel": {"font": ("Segoe UI", 14, "bold")},
+        "Hint.TLabel": {"foreground": "#555"},
+        "Card.TFrame": {"relief": "groove", "borderwidth": 2},
+    }
+
     def __init__(self):
         # Inicializar la ventana principal (constructor de Tk
         super().__init__()
@@ -141,23 +117,40 @@ class App(tk.Tk):
         # Asociar la tecla Enter para activar "Calcular" y mejorar usabilidad
         self.bind("<Return>", lambda _: self.on_calcular())
 
+        # Sin masas_atomicas.json, cargar el motor químico en segundo plano mientras
+        # el usuario escribe. Con la tabla generada no hace falta: el backend solo lo
+        # importa si alguna fórmula no se puede resolver con ella.
+        if not TABLA_GENERADA:
+            threading.Thread(target=cargar_motor_quimico, daemon=True).start()
+
+        # Cálculos en un hilo trabajador. Tkinter no es seguro entre hilos: el
+        # trabajador nunca toca widgets, solo deja el resultado en una cola que
+        # la UI vacía cada 50 ms con after() (ver _drain).
+        self._exec = ThreadPoolExecutor(max_workers=1)
+        self._q = queue.Queue()
+        self._ocupado = False
+        self.after(50, self._drain)
+
     # -------------------------
     # UTILIDADES DE INTERFAZ
     # -------------------------
     def _center_window(self, w: int, h: int):
         """
         Calcular la posición para centrar la ventana en la pantalla.
-        - update_idletasks(): asegura que las dimensiones y métricas estén actualizadas.
+        - Las medidas de la pantalla no dependen del layout de la ventana: no hace
+          falta update_idletasks() y se consultan una sola vez (caché en la clase).
+        - self.minsize(): establece tamaño mínimo para evitar que la UI quede
+          inutilizable; se fija antes de la geometría para no provocar otro ajuste.
         - self.geometry(): define posición y tamaño.
-        - self.minsize(): establece tamaño mínimo para evitar que la UI quede inutilizable.
         """
-        self.update_idletasks()
-        sw = self.winfo_screenwidth()   # ancho de la pantalla
-        sh = self.winfo_screenheight()  # alto de la pantalla
+        if App._pantalla is None:
+            # (ancho, alto) de la pantalla
+            App._pantalla = (self.winfo_screenwidth(), self.winfo_screenheight())
+        sw, sh = App._pantalla
         x = int((sw - w) / 2)
         y = int((sh - h) / 3)
-        self.geometry(f"{w}x{h}+{x}+{y}")
         self.minsize(620, 440)
+        self.geometry(f"{w}x{h}+{x}+{y}")
 
     def _apply_style(self):
         """
@@ -176,12 +169,9 @@ class App(tk.Tk):
         except tk.TclError:
             pass
 
-        # Configuraciones generales de estilo
-        style.configure("TButton", padding=8)
-        style.configure("TLabel", padding=2)
-        style.configure("Header.TLabel", font=("Segoe UI", 14, "bold"))
-        style.configure("Hint.TLabel", foreground="#555")
-        style.configure("Card.TFrame", relief="groove", borderwidth=2)
+        # Configuraciones generales de estilo (tabla _STYLES de la clase)
+        for nombre, opciones in self._STYLES.items():
+            style.configure(nombre, **opciones)
 
     def _make_menubar(self):
         """
@@ -213,8 +203,9 @@ class App(tk.Tk):
         """
         Crear y posicionar todos los widgets de la interfaz:
          - Contenedor principal con padding.
-         - Secciones (labelframes) para: datos del usuario, reactivo 1, reactivo 2, botones y salida.
-         - Campos de entrada ligados a variables StringVar (fácil lectura/escritura).
+         - Secciones (labelframes) para: datos del usuario, reactivo 1, reactivo 2,
+           balanceo de ecuaciones, botones y salida.
+         - Campos de entrada (ttk.Entry) que se leen directamente al pulsar un botón.
          - Botones con comandos directos (calcular, limpiar, salir).
         Diseño modular:
          - Cada 'tarjeta' (LabelFrame) es una sección lógica. Facilita migrar a
@@ -225,8 +216,7 @@ class App(tk.Tk):
         # Permitir que la UI sea redimensionable de forma proporcionada
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
-        container.columnconfigure(0, weight=1)
-        container.columnconfigure(1, weight=1)
+        self._cfg_cols(container, 0, 1)
 
         # Encabezado y texto de ayuda
         ttk.Label(container, text="Cálculos Estequiométricos", style="Header.TLabel").grid(
@@ -243,72 +233,84 @@ class App(tk.Tk):
         # -----------------------
         card_user = ttk.LabelFrame(container, text="Datos del usuario")
         card_user.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=2, pady=6)
-        for i in range(2):
-            card_user.columnconfigure(i, weight=1)
+        self._cfg_cols(card_user, 0, 1)
 
-        ttk.Label(card_user, text="Nombre:").grid(row=0, column=0, sticky="e", padx=6, pady=6)
-        # StringVar es un contenedor que sincroniza el valor entre la UI y el código
-        self.var_nombre = tk.StringVar()
-        ttk.Entry(card_user, textvariable=self.var_nombre).grid(row=0, column=1, sticky="ew", padx=6, pady=6)
+        self._field_label(card_user, "Nombre:", 0)
+        # Los campos solo se leen al pulsar un botón: se guarda el Entry y se usa
+        # entry.get(), sin StringVar intermedia (ni su variable Tcl sincronizada).
+        self.e_nombre = ttk.Entry(card_user)
+        self.e_nombre.grid(row=0, column=1, sticky="ew", padx=6, pady=6)
 
         # -----------------------
-        # Tarjeta: Reactivo 1
+        # Tarjetas: un reactivo por entrada de _REACTIVOS (mismo código para cada uno)
         # -----------------------
-        card_r1 = ttk.LabelFrame(container, text="Reactivo 1")
-        card_r1.grid(row=3, column=0, sticky="nsew", padx=(0, 4), pady=6)
-        card_r1.columnconfigure(1, weight=1)
-
-        ttk.Label(card_r1, text="Fórmula (ej: H2):").grid(row=0, column=0, sticky="e", padx=6, pady=6)
-        self.var_comp1 = tk.StringVar()
-        ttk.Entry(card_r1, textvariable=self.var_comp1).grid(row=0, column=1, sticky="ew", padx=6, pady=6)
-
-        ttk.Label(card_r1, text="Masa (g):").grid(row=1, column=0, sticky="e", padx=6, pady=6)
-        self.var_masa1 = tk.StringVar()
-        ttk.Entry(card_r1, textvariable=self.var_masa1).grid(row=1, column=1, sticky="ew", padx=6, pady=6)
+        # Los campos se guardan en dos listas paralelas (fórmulas y masas),
+        # en el mismo orden que las tarjetas: leerlos todos es una comprensión.
+        self.e_comps = []
+        self.e_masas = []
+        for i, (ejemplo, padx) in enumerate(self._REACTIVOS):
+            e_comp, e_masa = self._make_reactant_card(
+                container, f"Reactivo {i + 1}", ejemplo, column=i, padx=padx
+            )
+            self.e_comps.append(e_comp)
+            self.e_masas.append(e_masa)
 
         # -----------------------
-        # Tarjeta: Reactivo 2
+        # Tarjeta: Balanceo de ecuaciones
         # -----------------------
-        card_r2 = ttk.LabelFrame(container, text="Reactivo 2")
-        card_r2.grid(row=3, column=1, sticky="nsew", padx=(4, 0), pady=6)
-        card_r2.columnconfigure(1, weight=1)
-
-        ttk.Label(card_r2, text="Fórmula (ej: O2):").grid(row=0, column=0, sticky="e", padx=6, pady=6)
-        self.var_comp2 = tk.StringVar()
-        ttk.Entry(card_r2, textvariable=self.var_comp2).grid(row=0, column=1, sticky="ew", padx=6, pady=6)
-
-        ttk.Label(card_r2, text="Masa (g):").grid(row=1, column=0, sticky="e", padx=6, pady=6)
-        self.var_masa2 = tk.StringVar()
-        ttk.Entry(card_r2, textvariable=self.var_masa2).grid(row=1, column=1, sticky="ew", padx=6, pady=6)
+        card_eq = ttk.LabelFrame(container, text="Balanceo de ecuaciones")
+        card_eq.grid(row=4, column=0, columnspan=2, sticky="nsew", padx=2, pady=6)
+        self._cfg_cols(card_eq, 1)
+
+        self._field_label(card_eq, "Ecuación (ej: H2 + O2 -> H2O):", 0)
+        self.e_ecuacion = ttk.Entry(card_eq)
+        self.e_ecuacion.grid(row=0, column=1, sticky="ew", padx=6, pady=6)
+        # Enter dentro de este campo balancea en lugar de disparar "Calcular"
+        self.e_ecuacion.bind("<Return>", self._on_enter_ecuacion)
+        self.btn_balancear = ttk.Button(card_eq, text="Balancear", command=self.on_balancear)
+        self.btn_balancear.grid(row=0, column=2, padx=6, pady=6)
 
         # -----------------------
         # Botones de acción
         # -----------------------
         btns = ttk.Frame(container)
-        btns.grid(row=4, column=0, columnspan=2, sticky="ew", pady=6)
-        btns.columnconfigure(0, weight=1)
-        btns.columnconfigure(1, weight=1)
-        btns.columnconfigure(2, weight=1)
+        btns.grid(row=5, column=0, columnspan=2, sticky="ew", pady=6)
+        self._cfg_cols(btns, 0, 1, 2)
 
         # Botones enlazados a métodos: separación clara de responsabilidades
-        ttk.Button(btns, text="Calcular", command=self.on_calcular).grid(row=0, column=0, padx=6, pady=6, sticky="ew")
+        self.btn_calcular = ttk.Button(btns, text="Calcular", command=self.on_calcular)
+        self.btn_calcular.grid(row=0, column=0, padx=6, pady=6, sticky="ew")
         ttk.Button(btns, text="Limpiar", command=self.on_limpiar).grid(row=0, column=1, padx=6, pady=6, sticky="ew")
         ttk.Button(btns, text="Salir", command=self.on_salir).grid(row=0, column=2, padx=6, pady=6, sticky="ew")
 
         # -----------------------
-        # Área de resultados (con scrollbar)
+        # Área de resultados: tabla + registro de mensajes (ambos con scrollbar)
         # -----------------------
         salida_frame = ttk.LabelFrame(container, text="Salida")
-        salida_frame.grid(row=5, column=0, columnspan=2, sticky="nsew", pady=6)
-        container.rowconfigure(5, weight=1)
-        salida_frame.columnconfigure(0, weight=1)
-        salida_frame.rowconfigure(0, weight=1)
-
-        # Caja de texto para mostrar resultados. State=disabled evita edición directa.
-        self.txt_salida = tk.Text(salida_frame, height=10, wrap="word", state="disabled")
-        self.txt_salida.grid(row=0, column=0, sticky="nsew")
+        salida_frame.grid(row=6, column=0, columnspan=2, sticky="nsew", pady=6)
+        container.rowconfigure(6, weight=1)
+        self._cfg_cols(salida_frame, 0)
+        salida_frame.rowconfigure((0, 1), weight=1)
+
+        # Tabla de resultados: una fila por reactivo calculado. Insertar una fila
+        # no obliga a reformatear ni a refluir texto, aunque haya cientos.
+        self.tv_resultados = ttk.Treeview(
+            salida_frame, columns=self._COLUMNAS, show="headings", height=5
+        )
+        for columna, titulo in zip(self._COLUMNAS, self._TITULOS):
+            self.tv_resultados.heading(columna, text=titulo)
+            self.tv_resultados.column(columna, width=120, anchor="e")
+        self.tv_resultados.column("compuesto", anchor="w")
+        self.tv_resultados.grid(row=0, column=0, sticky="nsew")
+        scroll_tv = ttk.Scrollbar(salida_frame, command=self.tv_resultados.yview)
+        scroll_tv.grid(row=0, column=1, sticky="ns")
+        self.tv_resultados.configure(yscrollcommand=scroll_tv.set)
+
+        # Caja de texto para resúmenes, avisos y errores (deshabilitada: solo lectura)
+        self.txt_salida = tk.Text(salida_frame, height=6, wrap="word", state="disabled")
+        self.txt_salida.grid(row=1, column=0, sticky="nsew", pady=(6, 0))
         scrollbar = ttk.Scrollbar(salida_frame, command=self.txt_salida.yview)
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        scrollbar.grid(row=1, column=1, sticky="ns", pady=(6, 0))
         self.txt_salida.configure(yscrollcommand=scrollbar.set)
 
         # Barra de estado en la parte inferior: muestra mensajes breves de estado
@@ -316,6 +318,44 @@ class App(tk.Tk):
         status = ttk.Label(self, textvariable=self.var_status, anchor="w")
         status.grid(row=1, column=0, sticky="ew")
 
+    @staticmethod
+    def _field_label(parent, texto: str, fila: int):
+        """
+        Etiqueta de un campo de entrada: columna 0, alineada a la derecha.
+        Todas las etiquetas de campo comparten estilo (TLabel) y opciones de
+        grid (_FIELD_GRID), así se crean siempre por este único camino.
+        """
+        ttk.Label(parent, text=texto).grid(row=fila, column=0, **App._FIELD_GRID)
+
+    @staticmethod
+    def _cfg_cols(frame, *cols):
+        """
+        Dar peso 1 (columnas que se estiran) a varias columnas de un contenedor.
+        Tk acepta una lista de índices: es un único comando grid columnconfigure
+        en lugar de uno por columna.
+        """
+        frame.columnconfigure(cols, weight=1)
+
+    def _make_reactant_card(self, parent, titulo: str, ejemplo: str, column: int, padx):
+        """
+        Crear la tarjeta (LabelFrame) de un reactivo: fórmula y masa.
+        - Las etiquetas salen de _LABEL_SPEC, así todas las tarjetas son idénticas.
+        - Retorna los dos Entry (fórmula, masa) para que la UI los lea.
+        Diseño: un único camino de código por reactivo permite crecer a N
+        reactivos (por ejemplo, al incorporar balanceo) sin duplicar widgets.
+        """
+        card = ttk.LabelFrame(parent, text=titulo)
+        card.grid(row=3, column=column, sticky="nsew", padx=padx, pady=6)
+        self._cfg_cols(card, 1)
+
+        entradas = []
+        for texto, fila in self._LABEL_SPEC:
+            self._field_label(card, texto.format(ejemplo=ejemplo), fila)
+            entrada = ttk.Entry(card)
+            entrada.grid(row=fila, column=1, sticky="ew", padx=6, pady=6)
+            entradas.append(entrada)
+        return tuple(entradas)
+
     # =======================
     # MÉTODOS: MENSAJES Y EVENTOS
     # =======================
@@ -332,6 +372,7 @@ class App(tk.Tk):
 
     def on_salir(self):
         """Cerrar la aplicación (liberar recursos)."""
+        self._exec.shutdown(wait=False)
         self.destroy()
 
     def on_limpiar(self):
@@ -339,90 +380,180 @@ class App(tk.Tk):
         Limpiar campos de entrada y agregar una nota en el área de salida.
         Diseño: mantener una acción clara que restablezca el estado de la UI.
         """
-        self.var_comp1.set("")
-        self.var_masa1.set("")
-        self.var_comp2.set("")
-        self.var_masa2.set("")
+        for entrada in self.e_comps + self.e_masas + [self.e_ecuacion]:
+            entrada.delete(0, "end")
         self._append_salida("— Campos limpiados —\n")
         self.var_status.set("Campos limpios.")
 
     def _append_salida(self, text: str):
         """
-        Añadir texto al widget de salida de forma segura:
-        - Habilitar edición temporalmente.
-        - Insertar texto y desplazar al final.
-        - Volver a deshabilitar para evitar ediciones accidentales.
-        Esto evita que el usuario modifique el histórico de resultados.
+        Añadir texto al final del área de salida y desplazarla hasta él.
+        - El texto debe llegar ya terminado en "\n": cada llamador lo formatea
+          una sola vez, sin comprobaciones ni concatenaciones extra aquí.
+        - Habilitar edición temporalmente y volver a deshabilitarla: el usuario
+          no modifica el histórico de resultados. Cada trabajo hace una sola
+          inserción, así que son dos configure() por resultado.
         """
         self.txt_salida.configure(state="normal")
-        self.txt_salida.insert("end", text + ("\n" if not text.endswith("\n") else ""))
+        self.txt_salida.insert("end", text)
         self.txt_salida.see("end")
         self.txt_salida.configure(state="disabled")
 
+    def _append_row(self, comp: str, masa: float, mm: float, moles: float):
+        """Añadir una fila (compuesto, masa, masa molar, moles) a la tabla de resultados."""
+        self.tv_resultados.insert("", "end", values=(comp, f"{masa:.6g}", f"{mm:.6g}", f"{moles:.6g}"))
+
+    @staticmethod
+    def _leer(entrada, numerico: bool = False) -> str:
+        """
+        Leer un campo y normalizarlo en un único sitio:
+        - Quitar espacios en los extremos.
+        - En campos numéricos, pasar comas decimales a punto (str.translate con
+          la tabla _DEC: una sola pasada en C, sin cadenas intermedias).
+        """
+        texto = entrada.get().strip()
+        return texto.translate(_DEC) if numerico else texto
+
     def _validar_float(self, value: str, nombre_campo: str) -> float:
         """
-        Validar que la entrada es convertible a float.
-        - Normalizar comas a punto.
+        Validar que la entrada (ya normalizada con _leer) es un número decimal.
+        - Comprobar el formato con la expresión precompilada _NUM (sin provocar
+          ni capturar excepciones de float() en el caso normal) y convertir.
+        - Rechazar valores que desbordan a infinito ("1e999").
         - Lanzar ValueError con mensaje claro si falla.
         Diseño: centralizar validaciones para mantener consistencia.
         """
-        try:
-            v = float(value)
-            return v
-        except ValueError:
+        if not _NUM.fullmatch(value):
             raise ValueError(f"El valor de '{nombre_campo}' debe ser numérico.")
+        numero = float(value)
+        if not math.isfinite(numero):
+            raise ValueError(f"El valor de '{nombre_campo}' es demasiado grande.")
+        return numero
 
     def on_calcular(self):
         """
         Orquestador principal cuando el usuario presiona 'Calcular':
-          1. Leer valores desde StringVars.
+          1. Leer valores directamente de los campos (Entry.get()).
           2. Validar que las fórmulas estén presentes.
           3. Validar que las masas sean numéricas.
-          4. Mostrar un resumen en la salida.
-          5. Llamar al backend de cálculo (intentar_procesamiento).
-          6. Mostrar resultados y actualizar estado.
+          4. Enviar el cálculo (intentar_procesamiento) al hilo trabajador.
+          5. _drain entrega el resultado a _mostrar_calculo (tabla + resumen).
         Diseño para integración con sistemas de inspección/robótica:
           - En lugar de llamar directamente al cálculo local, la UI podría:
             a) Enviar los datos a un servicio REST (/compute) y recibir resultados.
             b) Publicar un mensaje en una cola (MQTT, RabbitMQ) para que el backend lo procese.
             c) Publicar un mensaje ROS si se integra con un robot (topic /compute_esteq).
+        La ventana sigue respondiendo mientras el trabajador calcula, incluso si
+        todavía está esperando a que termine de cargarse el motor químico.
+        Mientras hay un cálculo en curso se ignoran nuevas pulsaciones (botones
+        deshabilitados y Enter sin efecto) para no acumular trabajos.
         """
-        nombre = self.var_nombre.get().strip()
-        comp1 = self.var_comp1.get().strip()
-        comp2 = self.var_comp2.get().strip()
-        # Reemplazar comas por puntos para manejar decimales en locales que usan coma
-        masa1_txt = self.var_masa1.get().strip().replace(",", ".")
-        masa2_txt = self.var_masa2.get().strip().replace(",", ".")
+        if self._ocupado:
+            return
+        nombre = self._leer(self.e_nombre)
+        comps = [self._leer(entrada) for entrada in self.e_comps]
+        masas_txt = [self._leer(entrada, numerico=True) for entrada in self.e_masas]
 
         # Verificaciones de presencia mínima
-        if not comp1 or not comp2:
+        if not all(comps):
             messagebox.showwarning("Datos incompletos", "Ingrese las fórmulas de ambos reactivos.")
             return
 
         # Validar que las masas sean números
         try:
-            masa1 = self._validar_float(masa1_txt, "Masa (Reactivo 1)")
-            masa2 = self._validar_float(masa2_txt, "Masa (Reactivo 2)")
+            masas = [
+                self._validar_float(txt, f"Masa (Reactivo {i})")
+                for i, txt in enumerate(masas_txt, start=1)
+            ]
         except ValueError as e:
             messagebox.showerror("Entrada inválida", str(e))
             return
+        comp1, comp2 = comps
+        masa1, masa2 = masas
+
+        # Feedback visual: cambiar estado y procesar
+        self.var_status.set("Procesando...")
+        self._set_ocupado(True)
 
-        # Mostrar saludo opcional y resumen de entrada
+        # Saludo opcional y resumen de entrada: se muestran junto al resultado
         saludo = f"Hola {nombre}.\n" if nombre else ""
-        self._append_salida(
+        cabecera = (
             f"{saludo}=== CÁLCULOS ESTEQUIOMÉTRICOS ===\n"
             f"- Reactivo 1: {comp1}, masa: {masa1:.6g} g\n"
             f"- Reactivo 2: {comp2}, masa: {masa2:.6g} g\n"
         )
 
-        # Feedback visual: cambiar estado y procesar
-        self.var_status.set("Procesando...")
-        self.update_idletasks()
+        # Llamada al backend de cálculo (local en este ejemplo) en el hilo trabajador
+        fut = self._exec.submit(intentar_procesamiento, comp1, masa1, comp2, masa2)
+        fut.add_done_callback(lambda f: self._q.put((self._mostrar_calculo, cabecera, f)))
 
-        # Llamada al backend de cálculo (local en este ejemplo)
-        resultado = intentar_procesamiento(comp1, masa1, comp2, masa2)
-        self._append_salida(resultado + "\n")
-        self.var_status.set("Listo.")
+    def on_balancear(self):
+        """
+        Balancear la ecuación escrita por el usuario:
+          1. Leer y validar que la ecuación no esté vacía.
+          2. Enviar el balanceo (intentar_balanceo) al mismo hilo trabajador.
+          3. _drain entrega el texto resultante a _mostrar_texto.
+        """
+        if self._ocupado:
+            return
+        ecuacion = self._leer(self.e_ecuacion)
+        if not ecuacion:
+            messagebox.showwarning("Datos incompletos", "Ingrese la ecuación a balancear.")
+            return
+
+        self.var_status.set("Balanceando...")
+        self._set_ocupado(True)
+        cabecera = f"Ecuación: {ecuacion}\n"
+        fut = self._exec.submit(intentar_balanceo, ecuacion)
+        fut.add_done_callback(lambda f: self._q.put((self._mostrar_texto, cabecera, f)))
+
+    def _on_enter_ecuacion(self, _event):
+        """Enter en el campo de ecuación: balancear y cortar la propagación a la ventana."""
+        self.on_balancear()
+        return "break"
+
+    def _set_ocupado(self, ocupado: bool):
+        """Marcar si hay un trabajo en curso y (des)habilitar Calcular/Balancear."""
+        self._ocupado = ocupado
+        estado = ["disabled"] if ocupado else ["!disabled"]
+        self.btn_calcular.state(estado)
+        self.btn_balancear.state(estado)
+
+    def _drain(self):
+        """
+        Vaciar la cola de resultados en el hilo de la UI y reprogramarse.
+        - Cada elemento trae el método que lo muestra (_mostrar_calculo o
+          _mostrar_texto): solo aquí se tocan widgets con resultados del trabajador.
+        - f.result() no bloquea: el futuro ya terminó al entrar en la cola.
+        - Un error inesperado (del trabajador o al mostrar) se anota en el registro
+          y el bucle se reprograma siempre: la cola nunca deja de vaciarse.
+        """
+        try:
+            while True:
+                mostrar, cabecera, fut = self._q.get_nowait()
+                try:
+                    mostrar(cabecera, fut.result())
+                    self.var_status.set("Listo.")
+                except Exception as e:
+                    self._append_salida(f"{cabecera}Error inesperado: {e}\n")
+                    self.var_status.set("Error.")
+                finally:
+                    self._set_ocupado(False)
+        except queue.Empty:
+            pass
+        finally:
+            self.after(50, self._drain)
+
+    def _mostrar_calculo(self, cabecera: str, resultado: tuple):
+        """Filas del cálculo a la tabla; resumen de entrada y nota/aviso al registro."""
+        filas, mensaje = resultado
+        for fila in filas:
+            self._append_row(*fila)
+        self._mostrar_texto(cabecera, mensaje)
+
+    def _mostrar_texto(self, cabecera: str, texto: str):
+        """Resumen de entrada y resultado en una sola inserción en el registro."""
+        self._append_salida(f"{cabecera}{texto}\n")
 
 # ================================
 # PUNTO DE ENTRADA (MAIN)
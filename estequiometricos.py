@@ -1,11 +1,4 @@
-from periodictable import formula
-from tkinter import *
-
-
-def masa_molar(compuesto):
-    """Calcula la masa molar de un compuesto químico."""
-    f = formula(compuesto)
-    return f.mass
+from estequiometria_backend import masa_molar  # Misma masa molar (y caché) que la interfaz gráfica
 
 nombre = input("Hola, ¿cómo te llamas? ").capitalize()
 
@@ -0,0 +1,33 @@
+"""
+Genera masas_atomicas.json: masas atómicas medias (g/mol) de todos los
+elementos de `periodictable`.
+
+El backend (estequiometria_backend._cargar_masas_atomicas) carga este
+archivo al importarse, así que lo usan las dos interfaces: la gráfica
+(estequiometria_explica.py) y la de consola (estequiometricos.py). Con él
+resuelve las fórmulas simples sin importar `periodictable` ni analizar sus
+archivos de datos. Si el archivo no existe, usa su tabla integrada de
+elementos habituales.
+
+Ejecutar una vez (o al actualizar periodictable):
+  python3 generar_masas.py
+"""
+import json
+from pathlib import Path
+
+from periodictable import elements
+
+DESTINO = Path(__file__).with_name("masas_atomicas.json")
+
+
+def generar():
+    """Escribe {símbolo: masa} de cada elemento con masa conocida y devuelve cuántos."""
+    # El número 0 es el neutrón ("n"), que no es un elemento de una fórmula.
+    masas = {el.symbol: el.mass for el in elements if el.number > 0 and el.mass}
+    with open(DESTINO, "w", encoding="utf-8") as f:
+        json.dump(masas, f, indent=0, sort_keys=True)
+    return len(masas)
+
+
+if __name__ == "__main__":
+    print(f"{generar()} elementos escritos en {DESTINO.name}")
@@ -0,0 +1,83 @@
+"""
+Pruebas del balanceador (balanceo.py) y de su envoltorio para la UI.
+
+Ejecutar:
+  python3 -m unittest -v
+"""
+import unittest
+
+from balanceo import balancear, balancear_ecuacion, composicion
+from estequiometria_backend import intentar_balanceo
+
+
+class TestComposicion(unittest.TestCase):
+    def test_formulas_simples(self):
+        self.assertEqual(composicion("H2O"), {"H": 2, "O": 1})
+        self.assertEqual(composicion("C6H12O6"), {"C": 6, "H": 12, "O": 6})
+
+    def test_parentesis_anidados(self):
+        self.assertEqual(composicion("Ca(OH)2"), {"Ca": 1, "O": 2, "H": 2})
+        self.assertEqual(composicion("K4(Fe(CN)6)"), {"K": 4, "Fe": 1, "C": 6, "N": 6})
+
+    def test_formulas_invalidas(self):
+        for mala in ("", "h2o", "H2O!", "Ca(OH", "CaOH)2", "()", "H2\nO"):
+            with self.subTest(formula=mala):
+                with self.assertRaises(ValueError):
+                    composicion(mala)
+
+
+class TestBalancear(unittest.TestCase):
+    def test_coeficientes_minimos(self):
+        self.assertEqual(balancear(["H2", "O2"], ["H2O"]), [2, 1, 2])
+        self.assertEqual(balancear(["Fe", "O2"], ["Fe2O3"]), [4, 3, 2])
+
+    def test_orden_de_entrada_conservado(self):
+        self.assertEqual(balancear(["O2", "H2"], ["H2O"]), [1, 2, 2])
+
+    def test_sin_solucion_o_ambigua(self):
+        with self.assertRaises(ValueError):
+            balancear(["H2"], ["O2"])
+        with self.assertRaises(ValueError):
+            balancear(["H2", "O2"], ["H2O", "H2O2"])
+
+    def test_lado_vacio(self):
+        with self.assertRaises(ValueError):
+            balancear([], ["H2O"])
+
+
+class TestBalancearEcuacion(unittest.TestCase):
+    def test_ecuaciones(self):
+        casos = {
+            "H2 + O2 -> H2O": "2 H2 + O2 -> 2 H2O",
+            "Fe + O2 = Fe2O3": "4 Fe + 3 O2 -> 2 Fe2O3",
+            "Ca(OH)2 + HCl → CaCl2 + H2O": "Ca(OH)2 + 2 HCl -> CaCl2 + 2 H2O",
+        }
+        for ecuacion, esperado in casos.items():
+            with self.subTest(ecuacion=ecuacion):
+                self.assertEqual(balancear_ecuacion(ecuacion), esperado)
+
+    def test_coeficientes_escritos(self):
+        # Ya balanceada: se conserva, reducida a los mínimos enteros
+        self.assertEqual(balancear_ecuacion("2H2 + O2 -> 2 H2O"), "2 H2 + O2 -> 2 H2O")
+        self.assertEqual(balancear_ecuacion("4 H2 + 2 O2 -> 4 H2O"), "2 H2 + O2 -> 2 H2O")
+        # Mal balanceada o con ceros: se resuelve el sistema
+        self.assertEqual(balancear_ecuacion("3 H2 + O2 -> 2 H2O"), "2 H2 + O2 -> 2 H2O")
+        self.assertEqual(balancear_ecuacion("0 H2 + 0 O2 -> 0 H2O"), "2 H2 + O2 -> 2 H2O")
+
+    def test_ecuaciones_mal_escritas(self):
+        for mala in ("H2 + O2", "H2 -> O2 -> H2O", "-> H2O", "H2\nO -> H2O", "H2 + x -> H2O"):
+            with self.subTest(ecuacion=mala):
+                with self.assertRaises(ValueError):
+                    balancear_ecuacion(mala)
+
+
+class TestIntentarBalanceo(unittest.TestCase):
+    def test_resultado_y_errores_como_texto(self):
+        self.assertIn("2 H2 + O2 -> 2 H2O", intentar_balanceo("H2 + O2 -> H2O"))
+        for mala in ("H2\nO -> H2O", "H2 + O2", ""):
+            with self.subTest(ecuacion=mala):
+                self.assertTrue(intentar_balanceo(mala).startswith("No se pudo balancear"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Pruebas del backend de masas molares (estequiometria_backend.py).
+
+No dependen de que `periodictable` esté instalado: donde hace falta, el
+motor químico se sustituye con unittest.mock.
+
+Ejecutar:
+  python3 -m unittest -v
+"""
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import estequiometria_backend as backend
+
+
+class _SinCache(unittest.TestCase):
+    """Vaciar el caché de _mm para que cada prueba recorra el cálculo completo."""
+
+    def setUp(self):
+        backend._mm.cache_clear()
+        self.addCleanup(backend._mm.cache_clear)
+
+
+class TestMasaMolar(_SinCache):
+    def test_formula_con_parentesis_usa_la_tabla(self):
+        a = backend._ATOMIC
+        esperado = a["Ca"] + 2 * (a["O"] + a["H"])
+        with mock.patch.object(backend, "cargar_motor_quimico") as motor:
+            self.assertAlmostEqual(backend.masa_molar("Ca(OH)2"), esperado)
+        motor.assert_not_called()
+
+    def test_simple_mass_devuelve_none_si_no_puede(self):
+        self.assertIsNone(backend._simple_mass("Xx2"))   # símbolo fuera de la tabla
+        self.assertIsNone(backend._simple_mass("h2o"))   # fórmula no analizable
+
+    def test_recurre_a_periodictable_si_falta_un_simbolo(self):
+        falso = mock.Mock(return_value=SimpleNamespace(mass=42.0))
+        with mock.patch.object(backend, "cargar_motor_quimico", return_value=True), \
+                mock.patch.object(backend, "formula", falso):
+            self.assertEqual(backend.masa_molar("Xx2"), 42.0)
+        falso.assert_called_once_with("Xx2")
+
+    def test_sin_periodictable_lanza_runtimeerror(self):
+        with mock.patch.object(backend, "cargar_motor_quimico", return_value=False):
+            with self.assertRaises(RuntimeError):
+                backend.masa_molar("Xx2")
+
+
+class TestCalcularMoles(_SinCache):
+    def test_filas(self):
+        mm = backend.masa_molar("H2O")
+        filas = backend.calcular_moles(("H2O", "O2"), (36.0, 16.0))
+        self.assertEqual(len(filas), 2)
+        comp, masa, mm_fila, moles = filas[0]
+        self.assertEqual((comp, masa, mm_fila), ("H2O", 36.0, mm))
+        self.assertAlmostEqual(moles, 36.0 / mm)
+
+    def test_formula_repetida_se_resuelve_una_vez(self):
+        with mock.patch.object(backend, "_mm", wraps=backend._mm) as mm:
+            filas = backend.calcular_moles(("H2O", "H2O"), (18.0, 36.0))
+        mm.assert_called_once_with("H2O")
+        self.assertEqual([f[1] for f in filas], [18.0, 36.0])
+
+    def test_longitudes_distintas(self):
+        with self.assertRaises(ValueError):
+            backend.calcular_moles(("H2O", "O2"), (18.0,))
+
+
+class TestIntentarProcesamiento(_SinCache):
+    def test_resultado_y_nota(self):
+        filas, mensaje = backend.intentar_procesamiento("H2O", 18.0, "O2", 32.0)
+        self.assertEqual([f[0] for f in filas], ["H2O", "O2"])
+        self.assertEqual(mensaje, backend._NOTA)
+
+    def test_formula_irresoluble_sin_periodictable(self):
+        with mock.patch.object(backend, "cargar_motor_quimico", return_value=False):
+            filas, mensaje = backend.intentar_procesamiento("Xx2", 1.0, "H2O", 1.0)
+        self.assertEqual(filas, [])
+        self.assertIn("periodictable", mensaje)
+        self.assertTrue(mensaje.startswith("⚠️ Procesamiento en revisión"))
+
+    def test_otros_errores_como_mensaje(self):
+        with mock.patch.object(backend, "_mm", side_effect=ValueError("fórmula rara")):
+            filas, mensaje = backend.intentar_procesamiento("H2O", 1.0, "O2", 1.0)
+        self.assertEqual(filas, [])
+        self.assertIn("fórmula rara", mensaje)
+
+
+if __name__ == "__main__":
+    unittest.main()